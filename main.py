@@ -5,10 +5,11 @@ Simple command-line tool for selecting electric propulsion thrusters.
 """
 import argparse
 from src.models import MissionRequirements
-from src.selector import load_thrusters, select_thrusters, print_results
+from src.selector import load_catalog, select_thrusters, print_results
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description="Select optimal electric propulsion thruster for your mission",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -91,26 +92,42 @@ Examples:
         help="Path to thruster catalog JSON (default: data/thrusters.json)",
     )
 
-    args = parser.parse_args()
+    return parser
 
+
+# Built once at import so repeated main() calls reuse it
+_PARSER = _build_parser()
+
+
+def _validate_args(args: argparse.Namespace) -> tuple[float, float]:
+    """
+    Validate parsed arguments, exiting via the parser on bad input.
+
+    Returns:
+        (mass_weight, time_weight) normalized to sum to 1
+    """
     # Validate inputs
     if args.delta_v < 0:
-        parser.error("Delta-v must be zero or positive")
+        _PARSER.error("Delta-v must be zero or positive")
     if args.sat_mass <= 0:
-        parser.error("Satellite mass must be positive")
+        _PARSER.error("Satellite mass must be positive")
     if args.power <= 0:
-        parser.error("Power must be positive")
+        _PARSER.error("Power must be positive")
     if args.budget <= 0:
-        parser.error("Mass budget must be positive")
+        _PARSER.error("Mass budget must be positive")
 
     # Validate and normalize weights
     if not (0 <= args.mass_weight <= 1 and 0 <= args.time_weight <= 1):
-        parser.error("Weights must be between 0 and 1")
+        _PARSER.error("Weights must be between 0 and 1")
     weight_sum = args.mass_weight + args.time_weight
     if weight_sum <= 0:
-        parser.error("At least one of the weights must be positive")
-    mass_weight = args.mass_weight / weight_sum
-    time_weight = args.time_weight / weight_sum
+        _PARSER.error("At least one of the weights must be positive")
+    return args.mass_weight / weight_sum, args.time_weight / weight_sum
+
+
+def main(argv=None):
+    args = _PARSER.parse_args(argv)
+    mass_weight, time_weight = _validate_args(args)
 
     # Create mission requirements
     requirements = MissionRequirements(
@@ -124,8 +141,8 @@ Examples:
 
     # Load thrusters
     try:
-        thrusters = load_thrusters(args.data)
-        print(f"✓ Loaded {len(thrusters)} thrusters from catalog")
+        catalog = load_catalog(args.data)
+        print(f"✓ Loaded {len(catalog)} thrusters from catalog")
     except (FileNotFoundError, ValueError) as e:
         print(f"✗ Error: {e}")
         return 1
@@ -133,7 +150,7 @@ Examples:
     # Evaluate and rank
     results = select_thrusters(
         requirements,
-        thrusters,
+        catalog,
         mass_weight=mass_weight,
         time_weight=time_weight,
         show_infeasible=args.show_all,
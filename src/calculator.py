@@ -3,12 +3,17 @@ Core physics calculations for thruster performance.
 """
 
 import math
+from functools import lru_cache
+from typing import Callable
 from .models import Thruster, MissionRequirements, ThrusterPerformance
+from .catalog import ThrusterCatalog
 
 
 # Physical constants
 G0 = 9.81  # Standard gravity (m/s²)
 SECONDS_PER_DAY = 86400
+ORBITS_PER_DAY = 15  # Typical LEO orbit count
+MAX_FUEL_RATIO = 0.5  # Propellant share of total mass deemed realistic
 
 
 def calculate_propellant_mass(
@@ -31,8 +36,12 @@ def calculate_propellant_mass(
     if isp_s <= 0 or dry_mass_kg <= 0:
         return float("inf")
 
-    mass_ratio = math.exp(delta_v_ms / (isp_s * G0))
-    return dry_mass_kg * (mass_ratio - 1)
+    # No manoeuvre, no propellant
+    if delta_v_ms == 0.0:
+        return 0.0
+
+    # expm1 avoids cancellation in exp(x) - 1 for small Δv / v_e
+    return dry_mass_kg * math.expm1(delta_v_ms / (isp_s * G0))
 
 
 def calculate_mission_duration(
@@ -52,7 +61,7 @@ def calculate_mission_duration(
     Returns:
         Mission duration in days
     """
-    if thrust_N <= 0 or isp_s <= 0 or propellant_kg <= 0:
+    if thrust_N <= 0 or isp_s <= 0 or propellant_kg < 0:
         return float("inf")
 
     exhaust_velocity = isp_s * G0  # m/s
@@ -70,15 +79,24 @@ def calculate_mass_breakdown(
         (dry_mass_with_thruster, propellant_mass, total_mass, fuel_ratio)
     """
     dry_mass_with_thruster = requirements.satellite_dry_mass_kg + thruster.mass_kg
-    propellant_mass = calculate_propellant_mass(
+    propellant_mass, total_mass, fuel_ratio = _mass_breakdown(
         requirements.delta_v_ms, thruster.isp_s, dry_mass_with_thruster
     )
-    total_mass = dry_mass_with_thruster + propellant_mass
-    fuel_ratio = (propellant_mass / total_mass) if total_mass > 0 else float("inf")
 
     return dry_mass_with_thruster, propellant_mass, total_mass, fuel_ratio
 
 
+def _mass_breakdown(
+    delta_v_ms: float, isp_s: float, dry_mass_kg: float
+) -> tuple[float, float, float]:
+    """Propellant mass, total mass and fuel ratio from plain numbers."""
+    propellant_mass = calculate_propellant_mass(delta_v_ms, isp_s, dry_mass_kg)
+    total_mass = dry_mass_kg + propellant_mass
+    fuel_ratio = (propellant_mass / total_mass) if total_mass > 0 else float("inf")
+
+    return propellant_mass, total_mass, fuel_ratio
+
+
 def estimate_number_of_burns(
     mission_duration_days: float, thruster_power_W: float, available_power_W: float
 ) -> int:
@@ -97,8 +115,7 @@ def estimate_number_of_burns(
         Estimated number of discrete burns
     """
     # Assume ~15 orbits per day for LEO
-    orbits_per_day = 15
-    total_orbits = mission_duration_days * orbits_per_day
+    total_orbits = mission_duration_days * ORBITS_PER_DAY
 
     if thruster_power_W > available_power_W:
         # Duty cycling: 2 burns per orbit (at nodes)
@@ -108,18 +125,18 @@ def estimate_number_of_burns(
         return max(1, int(total_orbits / 10))
 
 
-def check_feasibility(
+def check_feasibility_cheap(
     thruster: Thruster, requirements: MissionRequirements
-) -> tuple[bool, list[str]]:
+) -> list[str]:
     """
-    Check if thruster meets mission feasibility constraints.
+    Run the feasibility checks that need no propellant calculation.
 
     Args:
         thruster: Thruster to evaluate
         requirements: Mission requirements
 
     Returns:
-        (is_feasible, list_of_reasons_if_not)
+        List of reasons the thruster fails TRL, power, Isp or thrust checks
     """
     reasons = []
 
@@ -142,10 +159,24 @@ def check_feasibility(
     if thruster.thrust_N <= 0:
         reasons.append("Thrust must be positive")
 
-    # Calculate required propellant
-    _, propellant_mass, total_mass, fuel_ratio = calculate_mass_breakdown(
-        thruster, requirements
-    )
+    return reasons
+
+
+def check_feasibility_mass(
+    total_mass: float, fuel_ratio: float, requirements: MissionRequirements
+) -> list[str]:
+    """
+    Run the feasibility checks on an already computed mass breakdown.
+
+    Args:
+        total_mass: Total wet mass in kg
+        fuel_ratio: Propellant fraction of total mass (0-1)
+        requirements: Mission requirements
+
+    Returns:
+        List of reasons the mass budget or fuel ratio is violated
+    """
+    reasons = []
 
     # Mass budget check
     if total_mass > requirements.mass_budget_kg:
@@ -155,12 +186,182 @@ def check_feasibility(
         )
 
     # Check for unrealistic propellant ratios (>50%)
-    if fuel_ratio > 0.5:
-        reasons.append(f"Fuel ratio {fuel_ratio*100:.1f}% too high (>50%)")
+    if fuel_ratio > MAX_FUEL_RATIO:
+        reasons.append(
+            f"Fuel ratio {fuel_ratio*100:.1f}% too high "
+            f"(>{MAX_FUEL_RATIO*100:.0f}%)"
+        )
+
+    return reasons
+
+
+def format_infeasibility_reasons(
+    thruster: Thruster,
+    requirements: MissionRequirements,
+    total_mass: float,
+    fuel_ratio: float,
+) -> list[str]:
+    """
+    Describe why a thruster already known to be infeasible was rejected.
+
+    Feasibility itself comes from the evaluator's boolean result; this is
+    only called for rejected thrusters that are actually reported.
+
+    Args:
+        thruster: Rejected thruster
+        requirements: Mission requirements
+        total_mass: Total wet mass in kg from the evaluation
+        fuel_ratio: Propellant fraction of total mass (0-1)
+
+    Returns:
+        Every failed check, TRL/power/Isp/thrust reasons first
+    """
+    return check_feasibility_cheap(thruster, requirements) + check_feasibility_mass(
+        total_mass, fuel_ratio, requirements
+    )
+
+
+def check_feasibility(
+    thruster: Thruster, requirements: MissionRequirements
+) -> tuple[bool, list[str]]:
+    """
+    Check if thruster meets mission feasibility constraints.
+
+    Mass budget and fuel ratio are only checked when the TRL, power,
+    Isp and thrust checks all pass.
+
+    Args:
+        thruster: Thruster to evaluate
+        requirements: Mission requirements
+
+    Returns:
+        (is_feasible, list_of_reasons_if_not)
+    """
+    reasons = check_feasibility_cheap(thruster, requirements)
+
+    # Propellant checks need an exp, so only run them if nothing failed yet
+    if not reasons:
+        _, _, total_mass, fuel_ratio = calculate_mass_breakdown(
+            thruster, requirements
+        )
+        reasons = check_feasibility_mass(total_mass, fuel_ratio, requirements)
 
     return (len(reasons) == 0, reasons)
 
 
+# Positions of values in an evaluator result row
+ROW_PROPELLANT_MASS = 0
+ROW_TOTAL_MASS = 1
+ROW_DURATION = 2
+ROW_NUM_BURNS = 3
+ROW_FUEL_RATIO = 4  # Fraction (0-1), not percent
+ROW_IS_FEASIBLE = 5
+ROW_MASS_SCORE = 6
+ROW_TIME_SCORE = 7
+ROW_COMBINED_SCORE = 8
+
+
+@lru_cache(maxsize=64)
+def _make_evaluator(
+    requirements: MissionRequirements, mass_weight: float, time_weight: float
+) -> Callable[[float, float, float, float, int], tuple]:
+    """
+    Build a per-thruster evaluator for one mission.
+
+    Mission-level invariants are computed once here and captured as
+    locals, so evaluating each thruster only does thruster-dependent work.
+    The physics itself comes from the public calculate_* helpers.
+    Evaluators are cached per (mission, weights), so repeated studies of
+    the same mission reuse them.
+
+    Returns:
+        evaluate(thrust_N, isp_s, power_W, mass_kg, trl) returning a row
+        indexed by the ROW_* constants
+    """
+    delta_v = requirements.delta_v_ms
+    satellite_mass = requirements.satellite_dry_mass_kg
+    available_power = requirements.available_power_W
+    max_acceptable_power = available_power * requirements.max_duty_cycle
+    mass_budget = requirements.mass_budget_kg
+    min_trl = requirements.min_trl
+    inv_budget = 1.0 / mass_budget
+    inv_year = 1.0 / 365.0  # Normalize duration to 1 year
+
+    def evaluate(
+        thrust: float, isp: float, power: float, mass: float, trl: int
+    ) -> tuple:
+        propellant_mass, total_mass, fuel_ratio = _mass_breakdown(
+            delta_v, isp, satellite_mass + mass
+        )
+        duration = calculate_mission_duration(thrust, isp, propellant_mass)
+        num_burns = estimate_number_of_burns(duration, power, available_power)
+
+        # Same thresholds as check_feasibility_cheap/_mass, without the text
+        is_feasible = (
+            trl >= min_trl
+            and power <= max_acceptable_power
+            and isp > 0
+            and thrust > 0
+            and total_mass <= mass_budget
+            and fuel_ratio <= MAX_FUEL_RATIO
+        )
+
+        # Scoring (lower is better for both)
+        mass_score = total_mass * inv_budget
+        time_score = duration * inv_year
+        combined_score = mass_weight * mass_score + time_weight * time_score
+
+        return (
+            propellant_mass,
+            total_mass,
+            duration,
+            num_burns,
+            fuel_ratio,
+            is_feasible,
+            mass_score,
+            time_score,
+            combined_score,
+        )
+
+    return evaluate
+
+
+def build_performance(
+    thruster: Thruster, requirements: MissionRequirements, row: tuple
+) -> ThrusterPerformance:
+    """
+    Wrap one evaluator row into a ThrusterPerformance.
+
+    Args:
+        thruster: Evaluated thruster
+        requirements: Mission requirements
+        row: Result row as returned by evaluate_thrusters
+
+    Returns:
+        Complete performance evaluation
+    """
+    # Reasons are only needed for rejected thrusters
+    reasons = []
+    if not row[ROW_IS_FEASIBLE]:
+        reasons = format_infeasibility_reasons(
+            thruster, requirements, row[ROW_TOTAL_MASS], row[ROW_FUEL_RATIO]
+        )
+
+    return ThrusterPerformance(
+        thruster=thruster,
+        propellant_mass_kg=row[ROW_PROPELLANT_MASS],
+        total_mass_kg=row[ROW_TOTAL_MASS],
+        mission_duration_days=row[ROW_DURATION],
+        num_burns_estimate=row[ROW_NUM_BURNS],
+        fuel_ratio_percent=row[ROW_FUEL_RATIO] * 100,
+        is_feasible=row[ROW_IS_FEASIBLE],
+        infeasibility_reasons=reasons,
+        mass_score=row[ROW_MASS_SCORE],
+        time_score=row[ROW_TIME_SCORE],
+        combined_score=row[ROW_COMBINED_SCORE],
+    )
+
+
 def evaluate_thruster(
     thruster: Thruster,
     requirements: MissionRequirements,
@@ -179,43 +380,47 @@ def evaluate_thruster(
     Returns:
         Complete performance evaluation
     """
-    # Calculate masses
-    _, propellant_mass, total_mass, fuel_ratio = calculate_mass_breakdown(
-        thruster, requirements
-    )
-
-    # Calculate duration
-    mission_duration = calculate_mission_duration(
-        thruster.thrust_N, thruster.isp_s, propellant_mass
+    row = _make_evaluator(requirements, mass_weight, time_weight)(
+        thruster.thrust_N,
+        thruster.isp_s,
+        thruster.power_W,
+        thruster.mass_kg,
+        thruster.trl,
     )
+    return build_performance(thruster, requirements, row)
 
-    # Estimate burns
-    num_burns = estimate_number_of_burns(
-        mission_duration, thruster.power_W, requirements.available_power_W
-    )
 
-    # Fuel ratio
-    fuel_ratio = fuel_ratio * 100
+def evaluate_thrusters(
+    requirements: MissionRequirements,
+    catalog: ThrusterCatalog,
+    mass_weight: float = 0.4,
+    time_weight: float = 0.6,
+) -> list[tuple]:
+    """
+    Evaluate a whole thruster catalog in a single pass.
 
-    # Feasibility check
-    is_feasible, reasons = check_feasibility(thruster, requirements)
+    Reads the catalog's numeric columns with a single evaluator built for
+    the mission. Infeasibility reasons are not built here; use
+    build_performance for the rows that are reported.
 
-    # Scoring (normalize by typical values)
-    # Lower is better for both
-    mass_score = total_mass / requirements.mass_budget_kg
-    time_score = mission_duration / 365  # Normalize to 1 year
-    combined_score = mass_weight * mass_score + time_weight * time_score
+    Args:
+        requirements: Mission requirements
+        catalog: Column-oriented thruster catalog
+        mass_weight: Weight for mass in scoring (0-1)
+        time_weight: Weight for time in scoring (0-1)
 
-    return ThrusterPerformance(
-        thruster=thruster,
-        propellant_mass_kg=propellant_mass,
-        total_mass_kg=total_mass,
-        mission_duration_days=mission_duration,
-        num_burns_estimate=num_burns,
-        fuel_ratio_percent=fuel_ratio,
-        is_feasible=is_feasible,
-        infeasibility_reasons=reasons,
-        mass_score=mass_score,
-        time_score=time_score,
-        combined_score=combined_score,
+    Returns:
+        One result row per thruster in catalog order, indexed by the
+        ROW_* constants
+    """
+    evaluate = _make_evaluator(requirements, mass_weight, time_weight)
+    return list(
+        map(
+            evaluate,
+            catalog.thrust_N,
+            catalog.isp_s,
+            catalog.power_W,
+            catalog.mass_kg,
+            catalog.trl,
+        )
     )
@@ -0,0 +1,56 @@
+"""
+Column-oriented thruster catalog.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterator, Sequence
+from .models import Thruster
+
+
+@dataclass(slots=True, frozen=True)
+class ThrusterCatalog:
+    """Thruster catalog stored as parallel per-attribute tuples."""
+
+    # Numeric columns used by the evaluator
+    thrust_N: tuple[float, ...]
+    isp_s: tuple[float, ...]
+    power_W: tuple[float, ...]
+    mass_kg: tuple[float, ...]
+    trl: tuple[int, ...]
+
+    # Row objects, used for reporting
+    thrusters: tuple[Thruster, ...] = field(repr=False)
+
+    @classmethod
+    def from_thrusters(cls, thrusters: Sequence[Thruster]) -> "ThrusterCatalog":
+        """
+        Build a catalog from Thruster objects.
+
+        Args:
+            thrusters: Thrusters in catalog order
+
+        Returns:
+            Catalog with one column per evaluated attribute
+        """
+        # No copy when given a tuple, as load_catalog does
+        thrusters = tuple(thrusters)
+        return cls(
+            thrust_N=tuple(t.thrust_N for t in thrusters),
+            isp_s=tuple(t.isp_s for t in thrusters),
+            power_W=tuple(t.power_W for t in thrusters),
+            mass_kg=tuple(t.mass_kg for t in thrusters),
+            trl=tuple(t.trl for t in thrusters),
+            thrusters=thrusters,
+        )
+
+    def __len__(self) -> int:
+        return len(self.thrusters)
+
+    def __getitem__(self, index: int) -> Thruster:
+        return self.thrusters[index]
+
+    def __iter__(self) -> Iterator[Thruster]:
+        return iter(self.thrusters)
+
+    def __repr__(self) -> str:
+        return f"ThrusterCatalog({len(self)} thrusters)"
@@ -2,10 +2,10 @@
 Data models for thruster selection system.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Thruster:
     """Represents an electric propulsion thruster."""
 
@@ -20,11 +20,10 @@ class Thruster:
     trl: int
     thrust_efficiency: float
     propellant: str
+    thrust_N: float = field(init=False)  # Thrust in Newtons, derived
 
-    @property
-    def thrust_N(self) -> float:
-        """Thrust in Newtons."""
-        return self.thrust_mN / 1000.0
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "thrust_N", self.thrust_mN / 1000.0)
 
     def __repr__(self) -> str:
         return (
@@ -34,7 +33,7 @@ class Thruster:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MissionRequirements:
     """Mission constraints and requirements."""
 
@@ -53,7 +52,7 @@ class MissionRequirements:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ThrusterPerformance:
     """Performance metrics for a thruster-mission combination."""
 
@@ -3,10 +3,39 @@ Thruster selection and ranking logic.
 """
 
 import json
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Sequence, Union
 from .models import Thruster, MissionRequirements, ThrusterPerformance
-from .calculator import evaluate_thruster
+from .catalog import ThrusterCatalog
+from .calculator import (
+    ROW_COMBINED_SCORE,
+    ROW_IS_FEASIBLE,
+    build_performance,
+    evaluate_thrusters,
+)
+
+try:
+    import orjson as _json  # Optional, faster parser
+except ImportError:
+    _json = json
+
+# String attributes that repeat across catalog entries
+INTERNED_FIELDS = ("type", "manufacturer", "propellant")
+
+# Report block for one feasible thruster, filled by print_results
+_FEASIBLE_TEMPLATE = (
+    "\n{i}. {name} ({type})\n"
+    "   Manufacturer: {manufacturer}\n"
+    "   Score: {score:.3f} (mass: {mass_score:.3f}, time: {time_score:.3f})\n"
+    "   Thrust: {thrust_mN} mN  |  Isp: {isp_s} s  |  "
+    "Power: {power_W} W  |  TRL: {trl}\n"
+    "   Thruster mass: {thruster_mass:.3f} kg  |  "
+    "Propellant: {propellant_mass:.3f} kg  |  Total: {total_mass:.3f} kg\n"
+    "   Mission duration: {days:.1f} days ({months:.1f} months)\n"
+    "   Fuel ratio: {fuel_ratio:.1f}%  |  Est. burns: {burns:,}\n"
+)
 
 
 def load_thrusters(data_path: str = "data/thrusters.json") -> List[Thruster]:
@@ -19,23 +48,54 @@ def load_thrusters(data_path: str = "data/thrusters.json") -> List[Thruster]:
     Returns:
         List of Thruster objects
     """
+    return list(load_catalog(data_path))
+
+
+def load_catalog(data_path: str = "data/thrusters.json") -> ThrusterCatalog:
+    """
+    Load thruster catalog from JSON file in column-oriented form.
+
+    Parsed catalogs are cached per file and reused until the file's
+    modification time or size changes.
+
+    Args:
+        data_path: Path to JSON file
+
+    Returns:
+        ThrusterCatalog
+    """
     path = Path(data_path)
     if not path.exists():
         raise FileNotFoundError(f"Thruster data not found: {data_path}")
 
-    with open(path, "r") as f:
-        data = json.load(f)
+    stat = path.stat()
+    return _load_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int) -> ThrusterCatalog:
+    """Parse a catalog file; mtime and size only serve as cache keys."""
+    data = _json.loads(Path(path).read_bytes())
 
     if "thrusters" not in data or not isinstance(data["thrusters"], list):
         raise ValueError("Invalid thruster catalog: missing 'thrusters' list")
 
-    thrusters = [Thruster(**item) for item in data["thrusters"]]
-    return thrusters
+    items = data["thrusters"]
+
+    # Share one string object per distinct repeated value
+    interned: dict[str, str] = {}
+    for item in items:
+        for key in INTERNED_FIELDS:
+            if key in item:
+                item[key] = interned.setdefault(item[key], item[key])
+
+    thrusters = tuple(Thruster(**item) for item in items)
+    return ThrusterCatalog.from_thrusters(thrusters)
 
 
 def select_thrusters(
     requirements: MissionRequirements,
-    thrusters: List[Thruster],
+    thrusters: Union[ThrusterCatalog, Sequence[Thruster]],
     mass_weight: float = 0.4,
     time_weight: float = 0.6,
     show_infeasible: bool = False,
@@ -45,7 +105,8 @@ def select_thrusters(
 
     Args:
         requirements: Mission requirements
-        thrusters: List of candidate thrusters
+        thrusters: Candidate thrusters; pass the ThrusterCatalog from
+            load_catalog to avoid rebuilding its columns on every call
         mass_weight: Weight for mass optimization (0-1)
         time_weight: Weight for time optimization (0-1)
         show_infeasible: Include infeasible options in results
@@ -53,20 +114,23 @@ def select_thrusters(
     Returns:
         Sorted list of ThrusterPerformance (best first)
     """
-    results = []
-
-    for thruster in thrusters:
-        performance = evaluate_thruster(
-            thruster, requirements, mass_weight, time_weight
-        )
+    if isinstance(thrusters, ThrusterCatalog):
+        catalog = thrusters
+    else:
+        catalog = ThrusterCatalog.from_thrusters(thrusters)
 
-        if show_infeasible or performance.is_feasible:
-            results.append(performance)
+    rows = evaluate_thrusters(requirements, catalog, mass_weight, time_weight)
 
-    # Sort by combined score (lower is better)
-    results.sort(key=lambda x: x.combined_score)
+    # Rank kept indices by combined score (lower is better)
+    scores = [row[ROW_COMBINED_SCORE] for row in rows]
+    if show_infeasible:
+        kept = range(len(rows))
+    else:
+        kept = [i for i, row in enumerate(rows) if row[ROW_IS_FEASIBLE]]
+    order = sorted(kept, key=scores.__getitem__)
 
-    return results
+    entries = catalog.thrusters
+    return [build_performance(entries[i], requirements, rows[i]) for i in order]
 
 
 def print_results(
@@ -82,65 +146,69 @@ def print_results(
         requirements: Mission requirements used
         verbose: Show detailed metrics
     """
-    print("\n" + "=" * 80)
-    print("THRUSTER SELECTION RESULTS")
-    print("=" * 80)
-    print(f"\n📋 Mission Requirements:")
-    print(f"   • Delta-v: {requirements.delta_v_ms} m/s")
-    print(f"   • Satellite dry mass: {requirements.satellite_dry_mass_kg} kg")
-    print(f"   • Available power: {requirements.available_power_W} W")
-    print(f"   • Mass budget: {requirements.mass_budget_kg} kg")
-    print(f"   • Minimum TRL: {requirements.min_trl}")
-
-    feasible = [r for r in results if r.is_feasible]
-    infeasible = [r for r in results if not r.is_feasible]
-
-    print(f"\n📊 Summary: {len(feasible)} feasible, {len(infeasible)} infeasible")
+    rule = "=" * 80
+    parts = [
+        f"\n{rule}\n"
+        f"THRUSTER SELECTION RESULTS\n"
+        f"{rule}\n"
+        f"\n📋 Mission Requirements:\n"
+        f"   • Delta-v: {requirements.delta_v_ms} m/s\n"
+        f"   • Satellite dry mass: {requirements.satellite_dry_mass_kg} kg\n"
+        f"   • Available power: {requirements.available_power_W} W\n"
+        f"   • Mass budget: {requirements.mass_budget_kg} kg\n"
+        f"   • Minimum TRL: {requirements.min_trl}\n"
+    ]
+
+    feasible, infeasible = [], []
+    for r in results:
+        (feasible if r.is_feasible else infeasible).append(r)
+
+    parts.append(
+        f"\n📊 Summary: {len(feasible)} feasible, {len(infeasible)} infeasible\n"
+    )
 
     if feasible:
-        print("\n" + "=" * 80)
-        print("✓ FEASIBLE THRUSTERS (ranked by combined score)")
-        print("=" * 80)
+        parts.append(
+            f"\n{rule}\n✓ FEASIBLE THRUSTERS (ranked by combined score)\n{rule}\n"
+        )
 
         for i, perf in enumerate(feasible, 1):
-            print(f"\n{i}. {perf.thruster.name} ({perf.thruster.type})")
-            print(f"   Manufacturer: {perf.thruster.manufacturer}")
-            print(
-                f"   Score: {perf.combined_score:.3f} "
-                f"(mass: {perf.mass_score:.3f}, time: {perf.time_score:.3f})"
-            )
-            print(
-                f"   Thrust: {perf.thruster.thrust_mN} mN  |  "
-                f"Isp: {perf.thruster.isp_s} s  |  "
-                f"Power: {perf.thruster.power_W} W  |  "
-                f"TRL: {perf.thruster.trl}"
-            )
-            print(
-                f"   Thruster mass: {perf.thruster.mass_kg:.3f} kg  |  "
-                f"Propellant: {perf.propellant_mass_kg:.3f} kg  |  "
-                f"Total: {perf.total_mass_kg:.3f} kg"
-            )
-            print(
-                f"   Mission duration: {perf.mission_duration_days:.1f} days "
-                f"({perf.mission_duration_days/30:.1f} months)"
-            )
-            print(
-                f"   Fuel ratio: {perf.fuel_ratio_percent:.1f}%  |  "
-                f"Est. burns: {perf.num_burns_estimate:,}"
-            )
+            thruster = perf.thruster
+            fields = {
+                "i": i,
+                "name": thruster.name,
+                "type": thruster.type,
+                "manufacturer": thruster.manufacturer,
+                "score": perf.combined_score,
+                "mass_score": perf.mass_score,
+                "time_score": perf.time_score,
+                "thrust_mN": thruster.thrust_mN,
+                "isp_s": thruster.isp_s,
+                "power_W": thruster.power_W,
+                "trl": thruster.trl,
+                "thruster_mass": thruster.mass_kg,
+                "propellant_mass": perf.propellant_mass_kg,
+                "total_mass": perf.total_mass_kg,
+                "days": perf.mission_duration_days,
+                "months": perf.mission_duration_days / 30,
+                "fuel_ratio": perf.fuel_ratio_percent,
+                "burns": perf.num_burns_estimate,
+            }
+            parts.append(_FEASIBLE_TEMPLATE.format_map(fields))
 
             if verbose:
-                print(f"   Propellant type: {perf.thruster.propellant}")
+                parts.append(f"   Propellant type: {thruster.propellant}\n")
 
     if infeasible:
-        print("\n" + "=" * 80)
-        print("✗ INFEASIBLE THRUSTERS")
-        print("=" * 80)
+        parts.append(f"\n{rule}\n✗ INFEASIBLE THRUSTERS\n{rule}\n")
 
         for perf in infeasible:
-            print(f"\n• {perf.thruster.name} ({perf.thruster.type})")
-            print(f"  Reasons:")
+            parts.append(f"\n• {perf.thruster.name} ({perf.thruster.type})\n")
+            parts.append("  Reasons:\n")
             for reason in perf.infeasibility_reasons:
-                print(f"    - {reason}")
+                parts.append(f"    - {reason}\n")
+
+    parts.append(f"\n{rule}\n\n")
 
-    print("\n" + "=" * 80 + "\n")
+    # Single write instead of one print per line
+    sys.stdout.write("".join(parts))